@@ -13,18 +13,23 @@
 # limitations under the License.
 """Main application."""
 
-import gi
-gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk
-
 from pepper_music_player.library import database
 from pepper_music_player.player import player
 from pepper_music_player.player import playlist
 from pepper_music_player import pubsub
-from pepper_music_player.ui import application
 
 
 def main() -> None:
+    # GTK and the UI modules are slow to import, so they're imported here
+    # instead of at the top level, for code that imports this module without
+    # running the UI.
+    # pylint: disable=import-outside-toplevel
+    import gi
+    gi.require_version('Gtk', '3.0')
+    from gi.repository import Gtk
+    from pepper_music_player.ui import application
+    # pylint: enable=import-outside-toplevel
+
     # TODO(dseomn): Switch to the real default database_dir, once there is one.
     database_dir = '.'
     library_db = database.Database(database_dir=database_dir)
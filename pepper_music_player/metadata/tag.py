@@ -14,14 +14,11 @@
 """Music tags."""
 
 import abc
-import collections
 import dataclasses
 import datetime
-import functools
 import math
-import operator
 import re
-from typing import ClassVar, Dict, Iterable, Mapping, Optional, Pattern, Tuple, Union
+from typing import ClassVar, Dict, Iterable, Mapping, Optional, Sequence, Tuple, Union
 
 import frozendict
 
@@ -110,6 +107,9 @@ class DurationHumanTag(DerivedTag):
             return (formatted,)
 
 
+_INDEX_OR_TOTAL_REGEX = re.compile(r'(?P<index>\d+)(?:/(?P<total>\d+))?')
+
+
 @dataclasses.dataclass(frozen=True)
 class IndexOrTotalTag(DerivedTag):
     """Tag deriving its value from index- and total-style tags.
@@ -123,9 +123,6 @@ class IndexOrTotalTag(DerivedTag):
         composite_tag: Tag of the form 'index' or 'index/total' to parse.
         plain_tags: Tags that contain only the intended values.
     """
-    # TODO(https://github.com/PyCQA/pylint/issues/3405): Remove pylint disable.
-    _COMPOSITE_REGEX: ClassVar[Pattern[str]] = re.compile(  # pylint: disable=invalid-name
-        r'(?P<index>\d+)(?:/(?P<total>\d+))?')
     is_index: bool
     composite_tag: Tag
     plain_tags: Tuple[Tag, ...] = ()
@@ -138,9 +135,10 @@ class IndexOrTotalTag(DerivedTag):
         composite_value = tags.one_or_none(self.composite_tag)
         if composite_value is None:
             return None
-        # TODO(https://github.com/google/pytype/issues/492): Remove pytype
-        # disable.
-        composite_match = self._COMPOSITE_REGEX.fullmatch(composite_value)  # pytype: disable=attribute-error
+        if composite_value.isdigit():
+            # Most values have only an index, so skip the regex for those.
+            return (composite_value,) if self.is_index else None
+        composite_match = _INDEX_OR_TOTAL_REGEX.fullmatch(composite_value)
         if composite_match is None:
             return (composite_value,) if self.is_index else None
         matched_value = composite_match.group(
@@ -185,6 +183,12 @@ PARSED_TRACKNUMBER = IndexOrTotalTag('~parsed_tracknumber',
                                      is_index=True,
                                      composite_tag=TRACKNUMBER)
 
+# Tags that are composed by something other than intersection.
+_NOT_INTERSECTED_TAG_NAMES = frozenset((
+    DURATION_SECONDS.name,
+    DURATION_HUMAN.name,
+))
+
 _DERIVED_TAGS = (
     DURATION_HUMAN,
     PARSED_DISCNUMBER,
@@ -216,22 +220,42 @@ class Tags(frozendict.frozendict, Mapping[ArbitraryTag, Tuple[str, ...]]):
             tags: Tags to represent, as a mapping from each tag name to all
                 values for that tag.
         """
-        # TODO(https://github.com/python/typing/issues/256): Use a type
-        # annotation instead of manually checking if the values are of type str.
+        if isinstance(tags, Tags):
+            super().__init__(tags)
+            return
+        normalized_tags = {}
         for name, values in tags.items():
+            # TODO(https://github.com/python/typing/issues/256): Use a type
+            # annotation instead of manually checking if the values are of type
+            # str.
             if isinstance(values, str):
                 raise TypeError(
                     'Tags takes an iterable of values for each tag, found: '
                     f'{_tag_name_str(name)!r}={values!r}')
-        super().__init__({
-            _tag_name_str(name): tuple(values) for name, values in tags.items()
-        })
+            # Avoid copying values that are already tuples, since that's the
+            # common case.
+            normalized_tags[_tag_name_str(name)] = (
+                values if type(values) is tuple else tuple(values))  # pylint: disable=unidiomatic-typecheck
+        super().__init__(normalized_tags)
+
+    @classmethod
+    def _from_normalized(cls, tags: Mapping[str, Tuple[str, ...]]) -> 'Tags':
+        """Returns Tags without validating or converting the input.
+
+        Args:
+            tags: Tags to represent, with str names and tuple values.
+        """
+        normalized_tags = cls.__new__(cls)
+        frozendict.frozendict.__init__(normalized_tags, tags)
+        return normalized_tags
+
+    # These inline _tag_name_str, since they're called very frequently.
 
     def __getitem__(self, key: ArbitraryTag) -> Tuple[str, ...]:
-        return super().__getitem__(_tag_name_str(key))
+        return super().__getitem__(key.name if isinstance(key, Tag) else key)
 
     def __contains__(self, key: ArbitraryTag) -> bool:
-        return super().__contains__(_tag_name_str(key))
+        return super().__contains__(key.name if isinstance(key, Tag) else key)
 
     def derive(
             self,
@@ -292,39 +316,69 @@ class Tags(frozendict.frozendict, Mapping[ArbitraryTag, Tuple[str, ...]]):
                 value.
         """
         for key in keys:
-            if key in self:
-                return separator.join(self[key])
+            values = self.get(key)
+            if values is not None:
+                # Avoid join() for the common case of a single value.
+                return values[0] if len(values) == 1 else separator.join(values)
         return default
 
 
+def _value_counts(values: Iterable[str]) -> Dict[str, int]:
+    """Returns the number of times each value occurs."""
+    counts = {}
+    for value in values:
+        counts[value] = counts.get(value, 0) + 1
+    return counts
+
+
 def _compose_intersection(
-        components_tags: Iterable[Tags]) -> Dict[str, Iterable[str]]:
+        components_tags: Sequence[Tags]) -> Dict[str, Tuple[str, ...]]:
     """Returns intersected tags."""
     if not components_tags:
         return {}
 
-    tag_pair_counters = []
-    for component_tags in components_tags:
-        tag_pairs = []
-        for name, values in component_tags.items():
-            if name in (
-                    DURATION_SECONDS.name,
-                    DURATION_HUMAN.name,
-            ):
-                # These are not intersected.
-                continue
-            tag_pairs.extend((name, value) for value in values)
-        tag_pair_counters.append(collections.Counter(tag_pairs))
-    common_tag_pair_counter = functools.reduce(operator.and_, tag_pair_counters)
-
-    tags = collections.defaultdict(list)
-    for name, value in common_tag_pair_counter.elements():
-        tags[name].append(value)
-    return tags
+    # Go from the component with the fewest values to the one with the most,
+    # since the intersection can only shrink and smaller components are more
+    # likely to shrink it sooner.
+    seed_tags, *other_components_tags = sorted(
+        components_tags, key=lambda tags: sum(map(len, tags.values())))
+    common_values = {
+        name: _value_counts(values)
+        for name, values in seed_tags.items()
+        if values and name not in _NOT_INTERSECTED_TAG_NAMES
+    }
+    for component_tags in other_components_tags:
+        for name in tuple(common_values):
+            counts = common_values[name]
+            other_counts = _value_counts(component_tags.get(name, ()))
+            for value, count in tuple(counts.items()):
+                other_count = other_counts.get(value, 0)
+                if not other_count:
+                    del counts[value]
+                elif other_count < count:
+                    counts[value] = other_count
+            if not counts:
+                del common_values[name]
+        if not common_values:
+            break
+
+    # Keep the values in the same order as the first component, regardless of
+    # which component the intersection started with.
+    first_tags = components_tags[0]
+    intersected_tags = {}
+    for name, counts in common_values.items():
+        values = []
+        for value in first_tags[name]:
+            count = counts.get(value, 0)
+            if count:
+                values.append(value)
+                counts[value] = count - 1
+        intersected_tags[name] = tuple(values)
+    return intersected_tags
 
 
 def _compose_duration(
-        components_tags: Iterable[Tags]) -> Dict[str, Iterable[str]]:
+        components_tags: Sequence[Tags]) -> Dict[str, Iterable[str]]:
     """Returns summed duration tags."""
     duration_seconds_values = [
         component_tags.one_or_none(DURATION_SECONDS)
@@ -351,7 +405,8 @@ def compose(components_tags: Iterable[Tags]) -> Tags:
     Args:
         components_tags: Tags for all the components.
     """
-    return Tags({
+    components_tags = tuple(components_tags)
+    return Tags._from_normalized({  # pylint: disable=protected-access
         **_compose_intersection(components_tags),
         **_compose_duration(components_tags),
     }).derive((DURATION_HUMAN,))
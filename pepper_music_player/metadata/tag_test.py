@@ -120,6 +120,14 @@ class TagsTest(unittest.TestCase):
             tag.Tags({'foo': ['a', 'b']})['foo'],
         )
 
+    def test_init_reuses_tuple_values(self):
+        values = ('a', 'b')
+        self.assertIs(values, tag.Tags({'foo': values})['foo'])
+
+    def test_init_from_tags(self):
+        tags = tag.Tags({'foo': ('a', 'b')})
+        self.assertEqual(tags, tag.Tags(tags))
+
     def test_init_rejects_single_string_value(self):
         with self.assertRaisesRegex(TypeError,
                                     'iterable of values for each tag'):
@@ -271,6 +279,32 @@ class TagsTest(unittest.TestCase):
             )),
         )
 
+    def test_compose_keeps_value_order_of_first_component(self):
+        self.assertEqual(
+            tag.Tags({
+                'artist': ('x', 'y', 'x'),
+            }),
+            tag.compose((
+                tag.Tags({
+                    'artist': ('x', 'y', 'x'),
+                    'title': ('t',),
+                    'genre': ('g1', 'g2'),
+                }),
+                tag.Tags({
+                    'artist': ('y', 'x', 'x'),
+                }),
+            )),
+        )
+
+    def test_compose_single_component_drops_empty_values(self):
+        self.assertEqual(
+            tag.Tags({'b': ('x',)}),
+            tag.compose((tag.Tags({
+                'a': (),
+                'b': ('x',),
+            }),)),
+        )
+
     def test_compose_duration(self):
         self.assertEqual(
             tag.Tags({
@@ -318,6 +352,26 @@ class TagsTest(unittest.TestCase):
             )),
         )
 
+    def test_compose_iterator(self):
+        self.assertEqual(
+            tag.Tags({
+                'common': ('foo',),
+                '~duration_seconds': ('2.7',),
+                '~duration_human': ('0∶03',),
+            }),
+            tag.compose(
+                iter((
+                    tag.Tags({
+                        'common': ('foo',),
+                        '~duration_seconds': ('1.3',),
+                    }),
+                    tag.Tags({
+                        'common': ('foo',),
+                        '~duration_seconds': ('1.4',),
+                    }),
+                ))),
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -17,7 +17,7 @@ import abc
 import enum
 import functools
 import logging
-from typing import Any, Callable, Optional, TypeVar
+from typing import Any, Callable, Mapping, Optional, Sequence, Tuple, TypeVar
 
 from pepper_music_player.metadata import entity
 from pepper_music_player.metadata import token
@@ -36,11 +36,33 @@ class ErrorPolicy(enum.Enum):
     Attributes:
         RETURN_NONE: Return None, as if it were a normal stop condition.
         RAISE_STOP_ERROR: Raise StopError.
-        DEFAULT: Default policy if none is specified, RETURN_NONE.
     """
     RETURN_NONE = enum.auto()
     RAISE_STOP_ERROR = enum.auto()
-    DEFAULT = RETURN_NONE
+
+
+# Default policy if none is specified.
+_DEFAULT_ERROR_POLICY = ErrorPolicy.RETURN_NONE
+
+
+def _handle_stop_error(error: StopError, error_policy: ErrorPolicy) -> None:
+    """Handles a StopError according to an ErrorPolicy.
+
+    This must be called from the except clause that caught the error.
+
+    Args:
+        error: Error to handle.
+        error_policy: What to do with the error.
+
+    Raises:
+        StopError: The error is re-raised if error_policy is
+            ErrorPolicy.RAISE_STOP_ERROR.
+    """
+    if error_policy is ErrorPolicy.RAISE_STOP_ERROR:
+        raise error
+    else:
+        assert error_policy is ErrorPolicy.RETURN_NONE
+        logging.exception('Stopping due to error.')
 
 
 def handle_stop_error(function: Callable[..., T]) -> Callable[..., Optional[T]]:
@@ -59,20 +81,16 @@ def handle_stop_error(function: Callable[..., T]) -> Callable[..., Optional[T]]:
     @functools.wraps(function)
     def _wrapper(
             *args: Any,
-            error_policy: ErrorPolicy = ErrorPolicy.DEFAULT,
+            error_policy: ErrorPolicy = _DEFAULT_ERROR_POLICY,
             **kwargs: Any,
     ) -> Optional[T]:  # pytype: disable=invalid-annotation  # yapf: disable
         try:
             return function(*args,
                             error_policy=ErrorPolicy.RAISE_STOP_ERROR,
                             **kwargs)
-        except StopError:
-            if error_policy is ErrorPolicy.RAISE_STOP_ERROR:
-                raise
-            else:
-                assert error_policy is ErrorPolicy.RETURN_NONE
-                logging.exception('Stopping due to error.')
-                return None
+        except StopError as error:
+            _handle_stop_error(error, error_policy)
+            return None
 
     return _wrapper
 
@@ -80,13 +98,15 @@ def handle_stop_error(function: Callable[..., T]) -> Callable[..., Optional[T]]:
 class Order(abc.ABC):
     """Interface for play orders."""
 
+    __slots__ = ()
+
     # TODO(https://github.com/google/yapf/issues/793): Remove yapf disable.
     @abc.abstractmethod
     def next(
             self,
             current: Optional[entity.PlayableUnit],
             *,
-            error_policy: ErrorPolicy = ErrorPolicy.DEFAULT,
+            error_policy: ErrorPolicy = _DEFAULT_ERROR_POLICY,
     ) -> Optional[entity.PlayableUnit]:  # yapf: disable
         """Returns the next unit to play, or None if there's nothing next.
 
@@ -107,7 +127,7 @@ class Order(abc.ABC):
             self,
             current: Optional[entity.PlayableUnit],
             *,
-            error_policy: ErrorPolicy = ErrorPolicy.DEFAULT,
+            error_policy: ErrorPolicy = _DEFAULT_ERROR_POLICY,
     ) -> Optional[entity.PlayableUnit]:  # yapf: disable
         """Returns the previous unit, or None if there's no previous unit.
 
@@ -130,12 +150,14 @@ class Order(abc.ABC):
 class Null(Order):
     """Always stops."""
 
+    __slots__ = ()
+
     # TODO(https://github.com/google/yapf/issues/793): Remove yapf disable.
     def next(  # pylint: disable=useless-return
             self,
             current: Optional[entity.PlayableUnit],
             *,
-            error_policy: ErrorPolicy = ErrorPolicy.DEFAULT,
+            error_policy: ErrorPolicy = _DEFAULT_ERROR_POLICY,
     ) -> Optional[entity.PlayableUnit]:  # yapf: disable
         """See base class."""
         del current, error_policy  # Unused.
@@ -146,7 +168,7 @@ class Null(Order):
             self,
             current: Optional[entity.PlayableUnit],
             *,
-            error_policy: ErrorPolicy = ErrorPolicy.DEFAULT,
+            error_policy: ErrorPolicy = _DEFAULT_ERROR_POLICY,
     ) -> Optional[entity.PlayableUnit]:  # yapf: disable
         """See base class."""
         del current, error_policy  # Unused.
@@ -161,6 +183,8 @@ class Base(Order):  # pylint: disable=abstract-method
         playlist: Playlist the order is following.
     """
 
+    __slots__ = ('playlist',)
+
     def __init__(self, playlist_: playlist.Playlist) -> None:
         """Initializer.
 
@@ -171,7 +195,50 @@ class Base(Order):  # pylint: disable=abstract-method
 
 
 class LinearEntry(Base):
-    """Plays a single entry through in order, then stops."""
+    """Plays a single entry through in order, then stops.
+
+    The playable units of the most recently used entry are cached, so changes
+    to the library entity in that entry might not be noticed until playback
+    moves to a different entry.
+    """
+
+    __slots__ = ('_cached_entry', '_cached_units', '_cached_indices')
+
+    def __init__(self, playlist_: playlist.Playlist) -> None:
+        """Initializer.
+
+        Args:
+            playlist_: Playlist.
+        """
+        super().__init__(playlist_)
+        self._cached_entry: Optional[entity.PlaylistEntry] = None
+        self._cached_units: Sequence[entity.PlayableUnit] = ()
+        self._cached_indices: Mapping[token.Track, int] = {}
+
+    def _units_and_indices(
+            self,
+            entry: entity.PlaylistEntry,
+    ) -> Tuple[Sequence[entity.PlayableUnit], Mapping[token.Track, int]]:
+        """Returns the playable units in an entry, and their indices.
+
+        Args:
+            entry: Playlist entry.
+
+        Returns:
+            Tuple of the playable units, and a mapping from each unit's track
+            token to its index in the playable units.
+
+        Raises:
+            KeyError: The playlist entry or library entity was not found.
+        """
+        if entry != self._cached_entry:
+            units = self.playlist.playable_units(entry)
+            self._cached_indices = {
+                unit.track.token: index for index, unit in enumerate(units)
+            }
+            self._cached_units = units
+            self._cached_entry = entry
+        return self._cached_units, self._cached_indices
 
     def _unit_in_same_entry(
             self,
@@ -191,13 +258,11 @@ class LinearEntry(Base):
         if current is None:
             return None
         try:
-            units = self.playlist.playable_units(current.playlist_entry)
+            units, indices = self._units_and_indices(current.playlist_entry)
         except KeyError:
             raise StopError('Current playlist entry not found.')
         try:
-            index = {
-                unit.track.token: index for index, unit in enumerate(units)
-            }[current.track.token]
+            index = indices[current.track.token]
         except KeyError:
             raise StopError(
                 f'Current track {current.track} does not exist in current '
@@ -211,33 +276,39 @@ class LinearEntry(Base):
             return None
 
     # TODO(https://github.com/google/yapf/issues/793): Remove yapf disable.
-    @handle_stop_error
     def next(
             self,
             current: Optional[entity.PlayableUnit],
             *,
-            error_policy: ErrorPolicy = ErrorPolicy.DEFAULT,
+            error_policy: ErrorPolicy = _DEFAULT_ERROR_POLICY,
     ) -> Optional[entity.PlayableUnit]:  # yapf: disable
         """See base class."""
-        del error_policy  # Unused.
-        return self._unit_in_same_entry(current, offset=1)
+        try:
+            return self._unit_in_same_entry(current, offset=1)
+        except StopError as error:
+            _handle_stop_error(error, error_policy)
+            return None
 
     # TODO(https://github.com/google/yapf/issues/793): Remove yapf disable.
-    @handle_stop_error
     def previous(
             self,
             current: Optional[entity.PlayableUnit],
             *,
-            error_policy: ErrorPolicy = ErrorPolicy.DEFAULT,
+            error_policy: ErrorPolicy = _DEFAULT_ERROR_POLICY,
     ) -> Optional[entity.PlayableUnit]:  # yapf: disable
         """See base class."""
-        del error_policy  # Unused.
-        return self._unit_in_same_entry(current, offset=-1)
+        try:
+            return self._unit_in_same_entry(current, offset=-1)
+        except StopError as error:
+            _handle_stop_error(error, error_policy)
+            return None
 
 
 class Linear(LinearEntry):
     """Plays the playlist through in order, then stops."""
 
+    __slots__ = ()
+
     def _unit_in_adjacent_entry(
             self,
             current: Optional[entity.PlayableUnit],
@@ -264,7 +335,8 @@ class Linear(LinearEntry):
         except LookupError:
             return None
         try:
-            return self.playlist.playable_units(entry)[index]
+            units, _ = self._units_and_indices(entry)
+            return units[index]
         except LookupError:
             raise StopError(
                 f'{entry} does not exist, or does not have a playable unit at '
@@ -276,7 +348,7 @@ class Linear(LinearEntry):
             self,
             current: Optional[entity.PlayableUnit],
             *,
-            error_policy: ErrorPolicy = ErrorPolicy.DEFAULT,
+            error_policy: ErrorPolicy = _DEFAULT_ERROR_POLICY,
     ) -> Optional[entity.PlayableUnit]:  # yapf: disable
         """See base class."""
         del error_policy  # Unused.
@@ -291,7 +363,7 @@ class Linear(LinearEntry):
             self,
             current: Optional[entity.PlayableUnit],
             *,
-            error_policy: ErrorPolicy = ErrorPolicy.DEFAULT,
+            error_policy: ErrorPolicy = _DEFAULT_ERROR_POLICY,
     ) -> Optional[entity.PlayableUnit]:  # yapf: disable
         """See base class."""
         del error_policy  # Unused.
@@ -306,13 +378,15 @@ class Linear(LinearEntry):
 class Repeat(Linear):
     """Plays the playlist through in order, then repeats from the beginning."""
 
+    __slots__ = ()
+
     # TODO(https://github.com/google/yapf/issues/793): Remove yapf disable.
     @handle_stop_error
     def next(
             self,
             current: Optional[entity.PlayableUnit],
             *,
-            error_policy: ErrorPolicy = ErrorPolicy.DEFAULT,
+            error_policy: ErrorPolicy = _DEFAULT_ERROR_POLICY,
     ) -> Optional[entity.PlayableUnit]:  # yapf: disable
         """See base class."""
         del error_policy  # Unused.
@@ -326,7 +400,7 @@ class Repeat(Linear):
             self,
             current: Optional[entity.PlayableUnit],
             *,
-            error_policy: ErrorPolicy = ErrorPolicy.DEFAULT,
+            error_policy: ErrorPolicy = _DEFAULT_ERROR_POLICY,
     ) -> Optional[entity.PlayableUnit]:  # yapf: disable
         """See base class."""
         del error_policy  # Unused.
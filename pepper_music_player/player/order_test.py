@@ -78,6 +78,9 @@ class LinearEntryTest(order_testlib.TestCase):
         super().setUp()
         self.order = order.LinearEntry(self.playlist)
 
+    def test_has_no_instance_dict(self):
+        self.assertFalse(hasattr(self.order, '__dict__'))
+
     def test_no_current_entry_next(self):
         self.assertIsNone(self.order.next(None))
 
@@ -113,6 +116,25 @@ class LinearEntryTest(order_testlib.TestCase):
             entity.PlayableUnit(playlist_entry=entry, track=tracks[1]),
         )
 
+    def test_reuses_playable_units_within_entry(self):
+        album = self.make_album(track_count=3)
+        tracks = album.mediums[0].tracks
+        entry = self.playlist.append(album.token)
+        with mock.patch.object(self.playlist,
+                               'playable_units',
+                               wraps=self.playlist.playable_units) as units:
+            self.assert_symmetrically_adjacent(
+                self.order,
+                entity.PlayableUnit(playlist_entry=entry, track=tracks[0]),
+                entity.PlayableUnit(playlist_entry=entry, track=tracks[1]),
+            )
+            self.assert_symmetrically_adjacent(
+                self.order,
+                entity.PlayableUnit(playlist_entry=entry, track=tracks[1]),
+                entity.PlayableUnit(playlist_entry=entry, track=tracks[2]),
+            )
+        units.assert_called_once_with(entry)
+
     def test_next_stops_at_end_of_entry(self):
         track = self.make_album().mediums[0].tracks[0]
         entry = self.playlist.append(track.token)
@@ -203,6 +225,32 @@ class LinearTest(LinearEntryTest):
                                 track=album2.mediums[0].tracks[0]),
         )
 
+    def test_reuses_playable_units_after_crossing_entries(self):
+        album1 = self.make_album(track_count=2)
+        entry1 = self.playlist.append(album1.token)
+        album2 = self.make_album(track_count=2)
+        entry2 = self.playlist.append(album2.token)
+        tracks2 = album2.mediums[0].tracks
+        with mock.patch.object(self.playlist,
+                               'playable_units',
+                               wraps=self.playlist.playable_units) as units:
+            self.assertEqual(
+                entity.PlayableUnit(playlist_entry=entry2, track=tracks2[0]),
+                self.order.next(
+                    entity.PlayableUnit(playlist_entry=entry1,
+                                        track=album1.mediums[0].tracks[-1])),
+            )
+            self.assertEqual(
+                entity.PlayableUnit(playlist_entry=entry2, track=tracks2[1]),
+                self.order.next(
+                    entity.PlayableUnit(playlist_entry=entry2,
+                                        track=tracks2[0])),
+            )
+        self.assertEqual(
+            [mock.call(entry1), mock.call(entry2)],
+            units.call_args_list,
+        )
+
 
 class LinearRaisesErrorTest(LinearTest):
     ERROR_POLICY = order.ErrorPolicy.RAISE_STOP_ERROR
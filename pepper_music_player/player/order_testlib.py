@@ -36,7 +36,7 @@ class TestCase(unittest.TestCase):
         playlist: Playlist to use with the Order.
         library_db: Library database used by the playlist.
     """
-    ERROR_POLICY = order.ErrorPolicy.DEFAULT
+    ERROR_POLICY = order.ErrorPolicy.RETURN_NONE
 
     def setUp(self):
         super().setUp()
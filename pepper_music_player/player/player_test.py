@@ -85,12 +85,12 @@ class _FakeOrder(order.Order):
         else:
             return None
 
-    def next(self, current, *, error_policy=order.ErrorPolicy.DEFAULT):
+    def next(self, current, *, error_policy=order.ErrorPolicy.RETURN_NONE):
         """See base class."""
         del error_policy  # Unused.
         return self._next_or_previous(current, index_if_none=0, offset=1)
 
-    def previous(self, current, *, error_policy=order.ErrorPolicy.DEFAULT):
+    def previous(self, current, *, error_policy=order.ErrorPolicy.RETURN_NONE):
         """See base class."""
         del error_policy  # Unused.
         return self._next_or_previous(current, index_if_none=-1, offset=-1)
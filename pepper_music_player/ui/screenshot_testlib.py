@@ -13,6 +13,7 @@
 # limitations under the License.
 """Helpers for screenshot testing."""
 
+import functools
 import os
 import pathlib
 import unittest
@@ -26,6 +27,18 @@ from gi.repository import Gtk
 from pepper_music_player.ui import application
 
 
+@functools.lru_cache(maxsize=None)
+def _screenshot_dir(artifact_dir: str) -> pathlib.Path:
+    """Returns the directory for screenshots, creating it if needed.
+
+    Args:
+        artifact_dir: Directory for all test artifacts.
+    """
+    screenshot_dir = pathlib.Path(artifact_dir).joinpath('screenshots')
+    screenshot_dir.mkdir(exist_ok=True)
+    return screenshot_dir
+
+
 def _screenshot(
         window: Gtk.OffscreenWindow,
         filepath: pathlib.Path,
@@ -68,6 +81,8 @@ class TestCase(unittest.TestCase):
 
         If the TEST_ARTIFACT_DIR environment variable is set, this will save the
         screenshot there for manual observation or external automated testing.
+        Otherwise, the widget is shown but not drawn, since there's nothing to
+        do with the drawing.
 
         This should not be called more than once from each test method, since it
         names the screenshots after the test method.
@@ -79,13 +94,10 @@ class TestCase(unittest.TestCase):
         window = Gtk.OffscreenWindow()
         window.add(widget)
         window.show_all()
-        GLib.idle_add(Gtk.main_quit)
-        Gtk.main()
         artifact_dir = os.getenv('TEST_ARTIFACT_DIR')
         if artifact_dir is None:
             return
-        screenshot_dir = pathlib.Path(artifact_dir).joinpath('screenshots')
-        screenshot_dir.mkdir(exist_ok=True)
+        screenshot_dir = _screenshot_dir(artifact_dir)
         _screenshot(window,
                     screenshot_dir.joinpath(f'{self.id()}.light-ltr.png'),
                     dark_theme=False,